@@ -126,6 +126,11 @@ class AsyncDownloader:
                     # If we get here, download was successful
                     return
                     
+            except asyncio.CancelledError:
+                # Don't leave a partial file behind when interrupted
+                if os.path.exists(filepath):
+                    os.remove(filepath)
+                raise
             except Exception as e:
                 print(f"Download error for {url}: {str(e)}")
                 if os.path.exists(filepath):
@@ -142,21 +147,22 @@ class DownloadManager:
         self.max_concurrent = max_concurrent
         self.executor = ThreadPoolExecutor(max_workers=max_concurrent)
         
+    async def run_downloads(self, downloads: list, progress_callback: Optional[Callable] = None) -> list:
+        """Download all files concurrently; returns each result or exception in order."""
+        async with AsyncDownloader(self.max_concurrent) as downloader:
+            tasks = []
+            for url, filepath in downloads:
+                task = asyncio.create_task(
+                    downloader.download_file(url, filepath, progress_callback)
+                )
+                tasks.append(task)
+            return await asyncio.gather(*tasks, return_exceptions=True)
+            
     def start_downloads(self, downloads: list, progress_callback: Optional[Callable] = None):
-        async def run_downloads():
-            async with AsyncDownloader(self.max_concurrent) as downloader:
-                tasks = []
-                for url, filepath in downloads:
-                    task = asyncio.create_task(
-                        downloader.download_file(url, filepath, progress_callback)
-                    )
-                    tasks.append(task)
-                await asyncio.gather(*tasks, return_exceptions=True)
-                
         def run_async_downloads():
-            asyncio.run(run_downloads())
+            return asyncio.run(self.run_downloads(downloads, progress_callback))
             
-        self.executor.submit(run_async_downloads)
+        return self.executor.submit(run_async_downloads)
         
     def shutdown(self):
         self.executor.shutdown(wait=False)
\ No newline at end of file
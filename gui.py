@@ -1,17 +1,17 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-from ttkthemes import ThemedTk
+import importlib
 import os
 from typing import Dict, List, Optional
 from m3u_parser import M3UParser, M3UEntry
-from async_downloader import DownloadManager
 from file_utils import ensure_unique_filename
 import threading
 from utils import get_extension_from_url, format_speed, format_status
 
 class M3UDownloaderGUI:
     def __init__(self):
-        self.window = ThemedTk(theme="equilux")  # Modern dark theme
+        # Plain Tk so the window paints without waiting on the theme engine
+        self.window = tk.Tk()
         self.window.title("M3U Downloader")
         self.window.geometry("1200x800")
         
@@ -24,11 +24,43 @@ class M3UDownloaderGUI:
         }
         
         self.window.configure(bg=self.colors['bg'])
-        self.download_manager = DownloadManager(max_concurrent=3)
+        self.download_manager = None  # Created on first download
         self.entries: List[M3UEntry] = []
         self.setup_gui()
         
-    def setup_gui(self):
+        # Heavy subsystems load once the window has been mapped and painted
+        self.window.bind("<Map>", self._on_first_map)
+        
+    def _on_first_map(self, event):
+        """Schedule the theme and network warm-up after the first paint."""
+        # Child widgets share the toplevel's bind tag, so ignore their events
+        if event.widget is not self.window:
+            return
+        self.window.unbind("<Map>")
+        # Expose events follow Map; the delay lets the first frame draw
+        self.window.after(100, self._apply_theme)
+        self.window.after(150, self._warm_up_network)
+        
+    def _apply_theme(self):
+        """Load ttkthemes lazily and switch to the dark theme."""
+        try:
+            from ttkthemes import ThemedStyle
+        except ImportError:
+            return  # Keep the default ttk theme
+        ThemedStyle(self.window).set_theme("equilux")  # Modern dark theme
+        self.setup_styles()
+        
+    def _warm_up_network(self):
+        """Import the HTTP stack in the background so the first download starts fast."""
+        def warm_up():
+            try:
+                importlib.import_module("async_downloader")
+            except ImportError as e:
+                print(f"Network stack warm-up error: {str(e)}")
+                
+        threading.Thread(target=warm_up, daemon=True).start()
+        
+    def setup_styles(self):
         # Style configuration
         style = ttk.Style()
         style.configure("Custom.TButton",
@@ -54,6 +86,19 @@ class M3UDownloaderGUI:
             foreground=self.colors['fg']
         )
         
+    def setup_base_style(self):
+        """Darken the default ttk theme so the first frame matches equilux."""
+        # Only touches the current theme, so equilux keeps its own colors
+        ttk.Style().configure(".",
+            background=self.colors['bg'],
+            foreground=self.colors['fg'],
+            fieldbackground=self.colors['bg']
+        )
+        
+    def setup_gui(self):
+        self.setup_base_style()
+        self.setup_styles()
+        
         # Main container
         main_container = ttk.Frame(self.window, padding="20")
         main_container.pack(fill=tk.BOTH, expand=True)
@@ -195,6 +240,12 @@ class M3UDownloaderGUI:
         if not os.path.exists(output_dir):
             os.makedirs(output_dir)
             
+        try:
+            from async_downloader import DownloadManager
+        except ImportError as e:
+            messagebox.showerror("Download Error", f"Failed to load downloader: {str(e)}")
+            return
+            
         # Update concurrent downloads
         try:
             max_concurrent = int(self.concurrent_var.get())
@@ -262,5 +313,6 @@ class M3UDownloaderGUI:
         self.window.mainloop()
         
     def _on_closing(self):
-        self.download_manager.shutdown()
+        if self.download_manager:
+            self.download_manager.shutdown()
         self.window.destroy()
\ No newline at end of file
@@ -1,5 +1,88 @@
-from gui import M3UDownloaderGUI
+import argparse
+import os
+import sys
 
-if __name__ == "__main__":
+
+def positive_int(value: str) -> int:
+    """argparse type for values that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def run_headless(m3u_file: str, output_dir: str, max_concurrent: int) -> int:
+    """Download every entry of an M3U file without loading Tk.
+
+    Returns the number of failed downloads.
+    """
+    import asyncio
+    from m3u_parser import M3UParser
+    from file_utils import ensure_unique_filename
+
+    try:
+        from async_downloader import DownloadManager
+    except ImportError as e:
+        sys.exit(f"Failed to load downloader: {str(e)}")
+
+    try:
+        entries = M3UParser.parse(m3u_file)
+    except Exception as e:
+        sys.exit(str(e))
+    os.makedirs(output_dir, exist_ok=True)
+
+    # ensure_unique_filename only checks the disk, so also track paths
+    # handed out in this run to keep duplicate titles apart
+    downloads = []
+    assigned = set()
+    for entry in entries:
+        name, ext = os.path.splitext(entry.filename)
+        filepath = ensure_unique_filename(output_dir, entry.filename)
+        counter = 1
+        while filepath in assigned:
+            filepath = ensure_unique_filename(output_dir, f"{name}_{counter}{ext}")
+            counter += 1
+        assigned.add(filepath)
+        downloads.append((entry.url, filepath))
+
+    def print_progress(filename: str, progress: float, speed: str = None):
+        print(f"{filename}: {progress:.1f}% {speed or ''}")
+
+    # Run on the main thread so Ctrl-C cancels the downloads
+    manager = DownloadManager(max_concurrent=max_concurrent)
+    print(f"Downloading {len(downloads)} items to {output_dir}")
+    results = asyncio.run(manager.run_downloads(downloads, progress_callback=print_progress))
+
+    failures = [(filepath, result) for (_, filepath), result in zip(downloads, results)
+                if isinstance(result, BaseException)]
+    for filepath, error in failures:
+        print(f"Failed: {os.path.basename(filepath)}: {str(error)}")
+    print(f"{len(downloads) - len(failures)} of {len(downloads)} downloads finished")
+    return len(failures)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="M3U Downloader")
+    parser.add_argument("m3u_file", nargs="?", help="M3U file to download (runs without the GUI)")
+    parser.add_argument("-o", "--output", default=".", help="Output directory for headless downloads")
+    parser.add_argument("-c", "--concurrent", type=positive_int, default=3, help="Concurrent downloads")
+    args = parser.parse_args()
+
+    if args.m3u_file:
+        try:
+            failures = run_headless(args.m3u_file, args.output, args.concurrent)
+        except KeyboardInterrupt:
+            print("Interrupted", file=sys.stderr)
+            sys.exit(130)
+        sys.exit(1 if failures else 0)
+
+    from gui import M3UDownloaderGUI
     app = M3UDownloaderGUI()
-    app.run()
\ No newline at end of file
+    app.run()
+
+
+if __name__ == "__main__":
+    main()
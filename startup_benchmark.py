@@ -0,0 +1,102 @@
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+# Cold-start budgets in milliseconds (best of several runs, summed self import time)
+BUDGETS = {
+    "main": 40.0,
+    "gui": 80.0,
+    "headless": 40.0,
+}
+
+# What each entry point imports; main.py defers the headless modules until a run
+ENTRY_IMPORTS = {
+    "headless": "m3u_parser, file_utils",
+}
+
+# Modules that must stay out of each entry point's startup path
+LAZY_MODULES = {
+    "main": ["tkinter", "gui", "async_downloader", "aiohttp", "aiofiles", "ttkthemes"],
+    "gui": ["async_downloader", "aiohttp", "aiofiles", "ttkthemes", "concurrent.futures"],
+    "headless": ["tkinter", "gui", "ttkthemes"],
+}
+
+
+def positive_int(value: str) -> int:
+    """argparse type for values that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def measure_import(module: str) -> Tuple[float, Dict[str, float]]:
+    """Import an entry point's modules in a fresh interpreter with -X importtime.
+
+    Returns the total import time in milliseconds and the cumulative time
+    of every imported module.
+    """
+    repo_dir = os.path.dirname(os.path.abspath(__file__))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {ENTRY_IMPORTS.get(module, module)}"],
+        cwd=repo_dir, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        stderr_lines = result.stderr.strip().splitlines()
+        reason = stderr_lines[-1] if stderr_lines else f"exit code {result.returncode}"
+        raise RuntimeError(f"Failed to import {module}: {reason}")
+
+    total_us = 0
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        total_us += int(self_us)
+        modules[name.strip()] = int(cumulative_us) / 1000
+    return total_us / 1000, modules
+
+
+def check_module(module: str, runs: int, budget: float) -> List[str]:
+    """Benchmark a module's cold start and return any budget violations."""
+    timings = [measure_import(module) for _ in range(runs)]
+    best_ms, modules = min(timings, key=lambda t: t[0])
+    print(f"{module}: {best_ms:.1f} ms (budget {budget:.1f} ms, best of {runs})")
+
+    slowest = sorted(modules.items(), key=lambda m: m[1], reverse=True)[:5]
+    for name, cumulative_ms in slowest:
+        print(f"    {cumulative_ms:8.1f} ms  {name}")
+
+    errors = []
+    if best_ms > budget:
+        errors.append(f"{module} took {best_ms:.1f} ms, over its {budget:.1f} ms budget")
+    for name in LAZY_MODULES.get(module, []):
+        if name in modules:
+            errors.append(f"{module} eagerly imports {name}")
+    return errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import-time benchmark for cold start")
+    parser.add_argument("modules", nargs="*", default=list(BUDGETS), help="Entry points or modules to benchmark")
+    parser.add_argument("-n", "--runs", type=positive_int, default=5, help="Runs per module")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply budgets, for slow machines")
+    args = parser.parse_args()
+
+    errors = []
+    for module in args.modules:
+        budget = BUDGETS.get(module, max(BUDGETS.values())) * args.scale
+        errors.extend(check_module(module, args.runs, budget))
+
+    for error in errors:
+        print(f"FAIL: {error}")
+    sys.exit(1 if errors else 0)
+
+
+if __name__ == "__main__":
+    main()